@@ -8,8 +8,10 @@ import sys
 # Add the app directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.db.base import Base
-from app.models import user, query, response, feedback, document
+from app.core.config import settings
+from app.db.base import Base, import_models
+
+import_models()
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -30,8 +32,8 @@ target_metadata = Base.metadata
 # ... etc.
 
 def get_url():
-    """Get database URL from environment or config"""
-    return os.getenv("DATABASE_URL", "sqlite:///./realestate.db")
+    """Get database URL from the environment or .env (same source as the app)"""
+    return settings.database_url
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -0,0 +1,34 @@
+"""hot path indexes
+
+Composite indexes for the feedback, history and response lookups.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 06:25:04.418230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_queries_user_id_created_at', 'queries', ['user_id', 'created_at'], unique=False)
+    op.create_index(op.f('ix_responses_query_id'), 'responses', ['query_id'], unique=False)
+    op.create_index('ix_feedback_response_id_user_id', 'feedback', ['response_id', 'user_id'], unique=False)
+    op.create_index('ix_feedback_response_id_is_positive', 'feedback', ['response_id', 'is_positive'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_feedback_response_id_is_positive', table_name='feedback')
+    op.drop_index('ix_feedback_response_id_user_id', table_name='feedback')
+    op.drop_index(op.f('ix_responses_query_id'), table_name='responses')
+    op.drop_index('ix_queries_user_id_created_at', table_name='queries')
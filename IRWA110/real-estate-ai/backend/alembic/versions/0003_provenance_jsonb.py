@@ -0,0 +1,41 @@
+"""provenance jsonb
+
+Store responses.provenance as JSONB on PostgreSQL; other backends keep JSON.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 06:41:17.902344
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('responses', 'provenance',
+                    type_=postgresql.JSONB(),
+                    existing_type=sa.JSON(),
+                    existing_nullable=True,
+                    postgresql_using='provenance::jsonb')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('responses', 'provenance',
+                    type_=sa.JSON(),
+                    existing_type=postgresql.JSONB(),
+                    existing_nullable=True,
+                    postgresql_using='provenance::json')
@@ -5,6 +5,178 @@ import math
 
 logger = logging.getLogger(__name__)
 
+# Lookup tables are module-level so they are built once, not on every analysis
+CITY_SCORES = {
+    # Major Cities
+    'Colombo': 0.95,
+    'Kandy': 0.90,
+    'Galle': 0.85,
+    'Jaffna': 0.80,
+    'Negombo': 0.85,
+    'Matara': 0.80,
+    'Anuradhapura': 0.75,
+    'Polonnaruwa': 0.70,
+    'Trincomalee': 0.80,
+    'Batticaloa': 0.75,
+    'Ratnapura': 0.70,
+    'Kurunegala': 0.75,
+    'Badulla': 0.70,
+    'Monaragala': 0.65,
+    'Vavuniya': 0.70,
+    'Mullaitivu': 0.65,
+    'Kilinochchi': 0.65,
+    'Ampara': 0.70,
+    'Puttalam': 0.75,
+    'Hambantota': 0.80,
+    'Kalutara': 0.80,
+    'Gampaha': 0.85,
+    'Nuwara Eliya': 0.80,
+    'Kegalle': 0.75,
+    'Unknown': 0.5
+}
+
+# Area-specific scores that override the city score
+AREA_SCORES = {
+    'Colombo': {
+        'Colombo 1': 0.98,  # Fort area - prime business district
+        'Colombo 2': 0.97,  # Slave Island - developing area
+        'Colombo 3': 0.96,  # Kollupitiya - upscale residential
+        'Colombo 4': 0.95,  # Bambalapitiya - prime residential
+        'Colombo 5': 0.94,  # Havelock Town - upscale area
+        'Colombo 6': 0.93,  # Wellawatte - beach area
+        'Colombo 7': 0.97,  # Cinnamon Gardens - most prestigious
+        'Colombo 8': 0.92,  # Borella - central residential
+        'Colombo 9': 0.91,  # Dematagoda - developing area
+        'Colombo 10': 0.90, # Maradana - central area
+        'Colombo 11': 0.89, # Pettah - commercial area
+        'Colombo 12': 0.88, # Peliyagoda - developing area
+        'Colombo 13': 0.87, # Wattala - suburban area
+        'Colombo 14': 0.86, # Grandpass - developing area
+        'Colombo 15': 0.85  # Modara - port area
+    },
+    'Kandy': {
+        'Peradeniya': 0.92,  # University area
+        'Katugastota': 0.88, # Commercial area
+        'Mahaiyawa': 0.85,   # Residential area
+        'Asgiriya': 0.90,    # Temple area
+        'Malwatte': 0.89     # Temple area
+    },
+    'Galle': {
+        'Galle Fort': 0.95,      # UNESCO heritage site
+        'Unawatuna': 0.90,       # Beach area
+        'Hikkaduwa': 0.88,       # Beach area
+        'Mirissa': 0.92,          # Beach area
+        'Weligama': 0.89          # Beach area
+    }
+}
+
+CITY_BULLETS = {
+    'Colombo': [
+        "Capital city with excellent infrastructure",
+        "Close to Bandaranaike International Airport",
+        "Major business and financial hub",
+        "Good public transportation (buses, trains)",
+        "International schools and universities",
+        "Modern shopping malls and restaurants",
+        "Healthcare facilities and hospitals",
+        "Port city with trade opportunities"
+    ],
+    'Kandy': [
+        "Cultural and historical significance",
+        "Pleasant climate and scenic beauty",
+        "Major tourist destination",
+        "Peradeniya University area",
+        "Temple of the Tooth Relic",
+        "Botanical Gardens",
+        "Tea plantations nearby",
+        "Cooler climate than coastal areas"
+    ],
+    'Galle': [
+        "Coastal city with beautiful beaches",
+        "UNESCO World Heritage site (Galle Fort)",
+        "Tourism and hospitality focus",
+        "Relaxed lifestyle",
+        "Historical Portuguese and Dutch influence",
+        "Good for retirement and tourism",
+        "Fishing industry",
+        "Close to other beach destinations"
+    ],
+    'Jaffna': [
+        "Northern cultural center",
+        "Growing economic opportunities",
+        "Unique cultural heritage",
+        "Development potential",
+        "University of Jaffna",
+        "Historical significance",
+        "Agricultural land",
+        "Peaceful environment"
+    ],
+    'Negombo': [
+        "Beach city near airport",
+        "Tourist-friendly area",
+        "Fishing industry",
+        "Good for expats and tourists",
+        "Historical churches",
+        "Lagoon and beach activities",
+        "Growing real estate market",
+        "Easy access to Colombo"
+    ],
+    'Matara': [
+        "Southern coastal city",
+        "Beautiful beaches",
+        "Historical significance",
+        "University of Ruhuna",
+        "Growing development",
+        "Good investment potential",
+        "Tourist attractions",
+        "Peaceful lifestyle"
+    ],
+    'Anuradhapura': [
+        "Ancient capital of Sri Lanka",
+        "UNESCO World Heritage site",
+        "Buddhist pilgrimage site",
+        "Historical significance",
+        "Agricultural land",
+        "Growing tourism",
+        "Cultural heritage",
+        "Investment potential"
+    ]
+}
+
+DEFAULT_CITY_BULLETS = [
+    "Developing area with potential",
+    "Local amenities available",
+    "Growing community",
+    "Investment opportunities"
+]
+
+COLOMBO_DISTRICT_BULLETS = {
+    'Colombo 1': [
+        "Prime business district",
+        "Financial institutions",
+        "Government offices",
+        "High commercial value"
+    ],
+    'Colombo 3': [
+        "Upscale residential area",
+        "Close to beach",
+        "International schools",
+        "High-end restaurants"
+    ],
+    'Colombo 7': [
+        "Most prestigious area",
+        "Diplomatic missions",
+        "Luxury residences",
+        "Exclusive clubs"
+    ],
+    'Colombo 5': [
+        "Upscale residential",
+        "Good schools",
+        "Shopping areas",
+        "Family-friendly"
+    ]
+}
+
 class LocationAgent:
     def __init__(self):
         self.location_data = {}  # Placeholder for real location database
@@ -44,80 +216,13 @@ class LocationAgent:
         
         # City-based scoring for Sri Lanka
         if city:
-            city_scores = {
-                # Major Cities
-                'Colombo': 0.95,
-                'Kandy': 0.90,
-                'Galle': 0.85,
-                'Jaffna': 0.80,
-                'Negombo': 0.85,
-                'Matara': 0.80,
-                'Anuradhapura': 0.75,
-                'Polonnaruwa': 0.70,
-                'Trincomalee': 0.80,
-                'Batticaloa': 0.75,
-                'Ratnapura': 0.70,
-                'Kurunegala': 0.75,
-                'Badulla': 0.70,
-                'Monaragala': 0.65,
-                'Vavuniya': 0.70,
-                'Mullaitivu': 0.65,
-                'Kilinochchi': 0.65,
-                'Ampara': 0.70,
-                'Puttalam': 0.75,
-                'Hambantota': 0.80,
-                'Kalutara': 0.80,
-                'Gampaha': 0.85,
-                'Nuwara Eliya': 0.80,
-                'Kegalle': 0.75,
-                'Unknown': 0.5
-            }
-            score = city_scores.get(city, 0.5)
-        
-        # District-based scoring for Colombo
-        if city == 'Colombo' and district:
-            district_scores = {
-                'Colombo 1': 0.98,  # Fort area - prime business district
-                'Colombo 2': 0.97,  # Slave Island - developing area
-                'Colombo 3': 0.96,  # Kollupitiya - upscale residential
-                'Colombo 4': 0.95,  # Bambalapitiya - prime residential
-                'Colombo 5': 0.94,  # Havelock Town - upscale area
-                'Colombo 6': 0.93,  # Wellawatte - beach area
-                'Colombo 7': 0.97,  # Cinnamon Gardens - most prestigious
-                'Colombo 8': 0.92,  # Borella - central residential
-                'Colombo 9': 0.91,  # Dematagoda - developing area
-                'Colombo 10': 0.90, # Maradana - central area
-                'Colombo 11': 0.89, # Pettah - commercial area
-                'Colombo 12': 0.88, # Peliyagoda - developing area
-                'Colombo 13': 0.87, # Wattala - suburban area
-                'Colombo 14': 0.86, # Grandpass - developing area
-                'Colombo 15': 0.85  # Modara - port area
-            }
-            if district in district_scores:
-                score = district_scores[district]
-        
-        # Special area scoring for other cities
-        if city == 'Kandy' and district:
-            kandy_districts = {
-                'Peradeniya': 0.92,  # University area
-                'Katugastota': 0.88, # Commercial area
-                'Mahaiyawa': 0.85,   # Residential area
-                'Asgiriya': 0.90,    # Temple area
-                'Malwatte': 0.89     # Temple area
-            }
-            if district in kandy_districts:
-                score = kandy_districts[district]
+            score = CITY_SCORES.get(city, 0.5)
         
-        if city == 'Galle' and district:
-            galle_districts = {
-                'Galle Fort': 0.95,      # UNESCO heritage site
-                'Unawatuna': 0.90,       # Beach area
-                'Hikkaduwa': 0.88,       # Beach area
-                'Mirissa': 0.92,          # Beach area
-                'Weligama': 0.89          # Beach area
-            }
-            if district in galle_districts:
-                score = galle_districts[district]
+        # District-based scoring for Colombo and special areas of other cities
+        if district:
+            area_scores = AREA_SCORES.get(city, {})
+            if district in area_scores:
+                score = area_scores[district]
         
         # Coordinate-based adjustments for Sri Lanka
         if lat and lon:
@@ -148,115 +253,12 @@ class LocationAgent:
         bullets = []
         
         if city:
-            city_bullets = {
-                'Colombo': [
-                    "Capital city with excellent infrastructure",
-                    "Close to Bandaranaike International Airport",
-                    "Major business and financial hub",
-                    "Good public transportation (buses, trains)",
-                    "International schools and universities",
-                    "Modern shopping malls and restaurants",
-                    "Healthcare facilities and hospitals",
-                    "Port city with trade opportunities"
-                ],
-                'Kandy': [
-                    "Cultural and historical significance",
-                    "Pleasant climate and scenic beauty",
-                    "Major tourist destination",
-                    "Peradeniya University area",
-                    "Temple of the Tooth Relic",
-                    "Botanical Gardens",
-                    "Tea plantations nearby",
-                    "Cooler climate than coastal areas"
-                ],
-                'Galle': [
-                    "Coastal city with beautiful beaches",
-                    "UNESCO World Heritage site (Galle Fort)",
-                    "Tourism and hospitality focus",
-                    "Relaxed lifestyle",
-                    "Historical Portuguese and Dutch influence",
-                    "Good for retirement and tourism",
-                    "Fishing industry",
-                    "Close to other beach destinations"
-                ],
-                'Jaffna': [
-                    "Northern cultural center",
-                    "Growing economic opportunities",
-                    "Unique cultural heritage",
-                    "Development potential",
-                    "University of Jaffna",
-                    "Historical significance",
-                    "Agricultural land",
-                    "Peaceful environment"
-                ],
-                'Negombo': [
-                    "Beach city near airport",
-                    "Tourist-friendly area",
-                    "Fishing industry",
-                    "Good for expats and tourists",
-                    "Historical churches",
-                    "Lagoon and beach activities",
-                    "Growing real estate market",
-                    "Easy access to Colombo"
-                ],
-                'Matara': [
-                    "Southern coastal city",
-                    "Beautiful beaches",
-                    "Historical significance",
-                    "University of Ruhuna",
-                    "Growing development",
-                    "Good investment potential",
-                    "Tourist attractions",
-                    "Peaceful lifestyle"
-                ],
-                'Anuradhapura': [
-                    "Ancient capital of Sri Lanka",
-                    "UNESCO World Heritage site",
-                    "Buddhist pilgrimage site",
-                    "Historical significance",
-                    "Agricultural land",
-                    "Growing tourism",
-                    "Cultural heritage",
-                    "Investment potential"
-                ]
-            }
-            bullets = city_bullets.get(city, [
-                "Developing area with potential",
-                "Local amenities available",
-                "Growing community",
-                "Investment opportunities"
-            ])
+            # Copy so the shared tables are never mutated
+            bullets = list(CITY_BULLETS.get(city, DEFAULT_CITY_BULLETS))
         
         # Add district-specific bullets for Colombo
-        if city == 'Colombo' and district:
-            district_bullets = {
-                'Colombo 1': [
-                    "Prime business district",
-                    "Financial institutions",
-                    "Government offices",
-                    "High commercial value"
-                ],
-                'Colombo 3': [
-                    "Upscale residential area",
-                    "Close to beach",
-                    "International schools",
-                    "High-end restaurants"
-                ],
-                'Colombo 7': [
-                    "Most prestigious area",
-                    "Diplomatic missions",
-                    "Luxury residences",
-                    "Exclusive clubs"
-                ],
-                'Colombo 5': [
-                    "Upscale residential",
-                    "Good schools",
-                    "Shopping areas",
-                    "Family-friendly"
-                ]
-            }
-            if district in district_bullets:
-                bullets.extend(district_bullets[district])
+        if city == 'Colombo' and district in COLOMBO_DISTRICT_BULLETS:
+            bullets.extend(COLOMBO_DISTRICT_BULLETS[district])
         
         # Add general location factors
         if lat and lon:
@@ -4,6 +4,84 @@ import random
 
 logger = logging.getLogger(__name__)
 
+# Lookup tables are module-level so they are built once, not on every estimate
+CITY_MULTIPLIERS = {
+    # Major Cities
+    'Colombo': 1.8,      # Highest property values
+    'Kandy': 1.4,        # Cultural capital
+    'Galle': 1.3,        # Tourist area
+    'Jaffna': 1.1,       # Northern capital
+    'Negombo': 1.2,      # Airport proximity
+    'Matara': 1.1,       # Southern coastal
+    'Anuradhapura': 1.0, # Historical city
+    'Polonnaruwa': 0.9,  # Historical city
+    'Trincomalee': 1.1,  # Port city
+    'Batticaloa': 1.0,   # Eastern coastal
+    'Ratnapura': 0.9,    # Gem city
+    'Kurunegala': 1.0,   # Central city
+    'Badulla': 0.9,      # Hill country
+    'Monaragala': 0.8,   # Rural area
+    'Vavuniya': 0.9,     # Northern area
+    'Mullaitivu': 0.8,   # Northern coastal
+    'Kilinochchi': 0.8,  # Northern area
+    'Ampara': 0.9,       # Eastern area
+    'Puttalam': 1.0,     # Northwestern
+    'Hambantota': 1.1,   # Southern port
+    'Kalutara': 1.2,     # Western coastal
+    'Gampaha': 1.3,      # Colombo suburb
+    'Nuwara Eliya': 1.2, # Hill station
+    'Kegalle': 1.0,      # Central area
+    'Unknown': 1.0
+}
+
+# Area-specific multipliers that override the city multiplier
+AREA_MULTIPLIERS = {
+    'Colombo': {
+        'Colombo 1': 2.2,   # Fort - prime business
+        'Colombo 2': 2.0,   # Slave Island
+        'Colombo 3': 1.9,   # Kollupitiya
+        'Colombo 4': 1.8,   # Bambalapitiya
+        'Colombo 5': 1.7,   # Havelock Town
+        'Colombo 6': 1.6,   # Wellawatte
+        'Colombo 7': 2.1,   # Cinnamon Gardens
+        'Colombo 8': 1.5,   # Borella
+        'Colombo 9': 1.4,   # Dematagoda
+        'Colombo 10': 1.3,  # Maradana
+        'Colombo 11': 1.2,  # Pettah
+        'Colombo 12': 1.1,  # Peliyagoda
+        'Colombo 13': 1.0,  # Wattala
+        'Colombo 14': 0.9,  # Grandpass
+        'Colombo 15': 0.8   # Modara
+    },
+    'Kandy': {
+        'Peradeniya': 1.5,   # University area
+        'Katugastota': 1.3,  # Commercial area
+        'Mahaiyawa': 1.2,    # Residential area
+        'Asgiriya': 1.4,     # Temple area
+        'Malwatte': 1.4      # Temple area
+    },
+    'Galle': {
+        'Galle Fort': 1.6,      # UNESCO heritage
+        'Unawatuna': 1.5,       # Beach area
+        'Hikkaduwa': 1.4,       # Beach area
+        'Mirissa': 1.5,          # Beach area
+        'Weligama': 1.4          # Beach area
+    }
+}
+
+PROPERTY_TYPE_MULTIPLIERS = {
+    'House': 1.0,           # Base type
+    'Apartment': 0.9,        # Generally cheaper per sqft
+    'Commercial': 1.2,       # Higher value for business
+    'Land': 0.7,             # Raw land
+    'Tea Estate': 0.8,       # Agricultural
+    'Villa': 1.3,            # Luxury houses
+    'Penthouse': 1.4,        # Premium apartments
+    'Office': 1.3,           # Commercial office
+    'Shop': 1.1,             # Retail space
+    'Hotel': 1.5             # Hospitality
+}
+
 class PriceAgent:
     def __init__(self):
         # Sri Lankan LKR pricing per square foot (in LKR)
@@ -81,99 +159,19 @@ class PriceAgent:
     
     def _get_city_multiplier(self, city: str, district: str = '') -> float:
         """Get city-specific price multiplier for Sri Lanka"""
-        city_multipliers = {
-            # Major Cities
-            'Colombo': 1.8,      # Highest property values
-            'Kandy': 1.4,        # Cultural capital
-            'Galle': 1.3,        # Tourist area
-            'Jaffna': 1.1,       # Northern capital
-            'Negombo': 1.2,      # Airport proximity
-            'Matara': 1.1,       # Southern coastal
-            'Anuradhapura': 1.0, # Historical city
-            'Polonnaruwa': 0.9,  # Historical city
-            'Trincomalee': 1.1,  # Port city
-            'Batticaloa': 1.0,   # Eastern coastal
-            'Ratnapura': 0.9,    # Gem city
-            'Kurunegala': 1.0,   # Central city
-            'Badulla': 0.9,      # Hill country
-            'Monaragala': 0.8,   # Rural area
-            'Vavuniya': 0.9,     # Northern area
-            'Mullaitivu': 0.8,   # Northern coastal
-            'Kilinochchi': 0.8,  # Northern area
-            'Ampara': 0.9,       # Eastern area
-            'Puttalam': 1.0,     # Northwestern
-            'Hambantota': 1.1,   # Southern port
-            'Kalutara': 1.2,     # Western coastal
-            'Gampaha': 1.3,      # Colombo suburb
-            'Nuwara Eliya': 1.2, # Hill station
-            'Kegalle': 1.0,      # Central area
-            'Unknown': 1.0
-        }
+        base_multiplier = CITY_MULTIPLIERS.get(city, 1.0)
         
-        base_multiplier = city_multipliers.get(city, 1.0)
-        
-        # District-specific adjustments for Colombo
-        if city == 'Colombo' and district:
-            district_multipliers = {
-                'Colombo 1': 2.2,   # Fort - prime business
-                'Colombo 2': 2.0,   # Slave Island
-                'Colombo 3': 1.9,   # Kollupitiya
-                'Colombo 4': 1.8,   # Bambalapitiya
-                'Colombo 5': 1.7,   # Havelock Town
-                'Colombo 6': 1.6,   # Wellawatte
-                'Colombo 7': 2.1,   # Cinnamon Gardens
-                'Colombo 8': 1.5,   # Borella
-                'Colombo 9': 1.4,   # Dematagoda
-                'Colombo 10': 1.3,  # Maradana
-                'Colombo 11': 1.2,  # Pettah
-                'Colombo 12': 1.1,  # Peliyagoda
-                'Colombo 13': 1.0,  # Wattala
-                'Colombo 14': 0.9,  # Grandpass
-                'Colombo 15': 0.8   # Modara
-            }
-            if district in district_multipliers:
-                return district_multipliers[district]
-        
-        # Special area adjustments for other cities
-        if city == 'Kandy' and district:
-            kandy_districts = {
-                'Peradeniya': 1.5,   # University area
-                'Katugastota': 1.3,  # Commercial area
-                'Mahaiyawa': 1.2,    # Residential area
-                'Asgiriya': 1.4,     # Temple area
-                'Malwatte': 1.4      # Temple area
-            }
-            if district in kandy_districts:
-                return kandy_districts[district]
-        
-        if city == 'Galle' and district:
-            galle_districts = {
-                'Galle Fort': 1.6,      # UNESCO heritage
-                'Unawatuna': 1.5,       # Beach area
-                'Hikkaduwa': 1.4,       # Beach area
-                'Mirissa': 1.5,          # Beach area
-                'Weligama': 1.4          # Beach area
-            }
-            if district in galle_districts:
-                return galle_districts[district]
+        # District-specific adjustments for Colombo and special areas of other cities
+        if district:
+            area_multipliers = AREA_MULTIPLIERS.get(city, {})
+            if district in area_multipliers:
+                return area_multipliers[district]
         
         return base_multiplier
     
     def _get_property_type_multiplier(self, property_type: str) -> float:
         """Get property type multiplier for Sri Lankan market"""
-        type_multipliers = {
-            'House': 1.0,           # Base type
-            'Apartment': 0.9,        # Generally cheaper per sqft
-            'Commercial': 1.2,       # Higher value for business
-            'Land': 0.7,             # Raw land
-            'Tea Estate': 0.8,       # Agricultural
-            'Villa': 1.3,            # Luxury houses
-            'Penthouse': 1.4,        # Premium apartments
-            'Office': 1.3,           # Commercial office
-            'Shop': 1.1,             # Retail space
-            'Hotel': 1.5             # Hospitality
-        }
-        return type_multipliers.get(property_type, 1.0)
+        return PROPERTY_TYPE_MULTIPLIERS.get(property_type, 1.0)
     
     def _calculate_confidence(self, features: Dict) -> float:
         """Calculate confidence based on feature completeness for Sri Lankan market"""
@@ -1,10 +1,15 @@
 import logging
 import re
+from functools import lru_cache
 from typing import Dict, List, Any
 import html
 
 logger = logging.getLogger(__name__)
 
+# Larger inputs bypass the memoization caches so clients cannot pin big strings in memory
+MAX_CACHED_INPUT_LENGTH = 1024
+CACHEABLE_FEATURE_TYPES = (str, int, float, bool, type(None))
+
 class SecurityAgent:
     def __init__(self):
         # Patterns for potentially harmful content
@@ -25,6 +30,10 @@ class SecurityAgent:
         # Compile patterns for efficiency
         self.toxicity_regex = re.compile('|'.join(self.toxicity_patterns), re.IGNORECASE)
         self.pii_regex = re.compile('|'.join(self.pii_patterns), re.IGNORECASE)
+        
+        # Per-instance memoization for the /property/query inputs (see cached_* below)
+        self._sanitize_cached = lru_cache(maxsize=4096)(self.sanitize_input)
+        self._validate_cached = lru_cache(maxsize=2048)(self._validate_features_key)
     
     def sanitize_input(self, text: str) -> str:
         """
@@ -147,6 +156,54 @@ class SecurityAgent:
         except Exception:
             return False
     
+    def cached_sanitize_input(self, text: str) -> str:
+        """
+        sanitize_input memoized for repeated query strings.
+        Inputs above MAX_CACHED_INPUT_LENGTH are sanitized without being retained.
+        """
+        if isinstance(text, str) and len(text) <= MAX_CACHED_INPUT_LENGTH:
+            return self._sanitize_cached(text)
+        return self.sanitize_input(text)
+    
+    def cached_validate_query_features(self, features: Dict) -> Dict[str, Any]:
+        """
+        validate_query_features memoized for repeated feature dicts.
+        Only small dicts of scalar values are cached; anything else is validated directly.
+        """
+        if not self._is_cacheable_features(features):
+            return self.validate_query_features(features)
+        
+        # The value type is part of the key so e.g. True and 1 are not conflated
+        key = frozenset((k, type(v), v) for k, v in features.items())
+        result = self._validate_cached(key)
+        
+        # Hand out copies so callers cannot mutate the cached entry
+        return {
+            'is_valid': result['is_valid'],
+            'sanitized_features': dict(result['sanitized_features']),
+            'errors': list(result['errors'])
+        }
+    
+    def _is_cacheable_features(self, features: Any) -> bool:
+        """Scalar values only, with a bounded total size so large inputs are never retained"""
+        if not isinstance(features, dict):
+            return False
+        
+        size = 0
+        for k, v in features.items():
+            if not isinstance(k, str) or not isinstance(v, CACHEABLE_FEATURE_TYPES):
+                return False
+            if isinstance(v, str):
+                size += len(k) + len(v)
+            elif isinstance(v, int):
+                size += len(k) + v.bit_length() // 8 + 1
+            else:
+                size += len(k) + 1
+        return size <= MAX_CACHED_INPUT_LENGTH
+    
+    def _validate_features_key(self, key: frozenset) -> Dict[str, Any]:
+        return self.validate_query_features({k: v for k, _, v in key})
+    
     def validate_query_features(self, features: Dict) -> Dict[str, Any]:
         """
         Validate and sanitize query features.
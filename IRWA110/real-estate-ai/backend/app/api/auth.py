@@ -1,19 +1,35 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy import select, insert
+from sqlalchemy.exc import IntegrityError
 from pydantic import BaseModel, EmailStr
+from cachetools import TTLCache
+from typing import Optional
 from app.db.base import get_db
 from app.models.user import User
-from app.core.security import verify_password, get_password_hash, create_access_token, verify_token
+from app.core.security import verify_and_update_password, get_password_hash, create_access_token, verify_token
 from app.core.config import settings
+import hashlib
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 security = HTTPBearer()
 
+# Verified JWT payloads keyed by sha256(token) - the raw token is never stored
+_payload_cache = TTLCache(maxsize=10_000, ttl=settings.token_cache_ttl_seconds)
+_payload_cache_lock = threading.Lock()
+
+# Column snapshots of authenticated users keyed by user id
+_user_cache = TTLCache(maxsize=5000, ttl=settings.user_cache_ttl_seconds)
+_user_cache_lock = threading.Lock()
+_USER_CACHE_COLUMNS = ("id", "email", "username", "is_active", "hashed_password")
+
 # Pydantic models
 class UserSignup(BaseModel):
     email: EmailStr
@@ -29,18 +45,90 @@ class UserResponse(BaseModel):
     email: str
     username: str
     is_active: bool
+    
+    class Config:
+        from_attributes = True
 
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
 
+# Token payload cache helpers
+def _token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def _get_token_payload(token: str) -> Optional[dict]:
+    """Return the verified payload for a token, skipping JWT verification on cache hits"""
+    key = _token_cache_key(token)
+    now = time.time()
+    
+    with _payload_cache_lock:
+        cached = _payload_cache.get(key)
+    
+    if cached is not None:
+        payload, expires_at = cached
+        if expires_at > now:
+            return payload
+        with _payload_cache_lock:
+            _payload_cache.pop(key, None)
+    
+    payload = verify_token(token)
+    if payload is None:
+        return None
+    
+    # Never keep a payload around past the token's own expiry
+    expires_at = now + settings.token_cache_ttl_seconds
+    if "exp" in payload:
+        expires_at = min(float(payload["exp"]), expires_at)
+    
+    with _payload_cache_lock:
+        _payload_cache[key] = (payload, expires_at)
+    
+    return payload
+
+def invalidate_token_cache(token: str) -> None:
+    """Evict a token's cached payload (e.g. on logout)
+
+    The cache is per process: with several workers this only clears the
+    calling worker's copy, others expire it after TOKEN_CACHE_TTL_SECONDS.
+    """
+    with _payload_cache_lock:
+        _payload_cache.pop(_token_cache_key(token), None)
+
+# User cache helpers
+def _get_cached_user(user_id: str) -> Optional[User]:
+    """Rebuild a detached User from its cached snapshot without touching the DB"""
+    with _user_cache_lock:
+        snapshot = _user_cache.get(str(user_id))
+    
+    if snapshot is None:
+        return None
+    
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+def _cache_user(user: User) -> None:
+    snapshot = {column: getattr(user, column) for column in _USER_CACHE_COLUMNS}
+    with _user_cache_lock:
+        _user_cache[str(user.id)] = snapshot
+
+def invalidate_user_cache(user_id) -> None:
+    """Evict a cached user; call after any password or profile update
+
+    The cache is per process: with several workers this only clears the
+    calling worker's copy, others expire it after USER_CACHE_TTL_SECONDS.
+    """
+    with _user_cache_lock:
+        _user_cache.pop(str(user_id), None)
+
 # Helper function to get current user
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     token = credentials.credentials
-    payload = verify_token(token)
+    payload = _get_token_payload(token)
     
     if payload is None:
         raise HTTPException(
@@ -50,16 +138,19 @@ async def get_current_user(
         )
     
     user_id = payload.get("sub")
-    if user_id is None:
+    if user_id is None or not str(user_id).isdigit():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Updated to SQLAlchemy 2.x syntax
-    stmt = select(User).where(User.id == user_id)
-    user = db.execute(stmt).scalar_one_or_none()
+    user = _get_cached_user(user_id)
+    if user is not None:
+        return user
+    
+    # Primary-key lookup goes through the session identity map first
+    user = await db.get(User, int(user_id))
     
     if user is None:
         raise HTTPException(
@@ -68,24 +159,13 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    _cache_user(user)
     return user
 
 @router.post("/signup", response_model=TokenResponse)
-async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
+async def signup(user_data: UserSignup, db: AsyncSession = Depends(get_db)):
     """Create a new user account"""
     try:
-        # Check if user already exists - Updated to SQLAlchemy 2.x syntax
-        stmt = select(User).where(
-            (User.email == user_data.email) | (User.username == user_data.username)
-        )
-        existing_user = db.execute(stmt).scalar_one_or_none()
-        
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User with this email or username already exists"
-            )
-        
         # Validate password length
         if len(user_data.password) < settings.min_password_length:
             raise HTTPException(
@@ -93,22 +173,28 @@ async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
                 detail=f"Password must be at least {settings.min_password_length} characters long"
             )
         
-        # Create new user
+        # Create new user - the unique email/username constraints reject duplicates
         hashed_password = get_password_hash(user_data.password)
-        new_user = User(
+        stmt = insert(User).values(
             email=user_data.email,
             username=user_data.username,
             hashed_password=hashed_password
-        )
+        ).returning(User.id)
         
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        try:
+            user_id = (await db.execute(stmt)).scalar_one()
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User with this email or username already exists"
+            )
         
         # Generate access token
-        access_token = create_access_token(data={"sub": str(new_user.id)})
+        access_token = create_access_token(data={"sub": str(user_id)})
         
-        logger.info(f"New user created: {new_user.email}")
+        logger.info(f"New user created: {user_data.email}")
         
         return TokenResponse(access_token=access_token)
         
@@ -116,21 +202,25 @@ async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
         raise
     except Exception as e:
         logger.error(f"Error in user signup: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during signup"
         )
 
 @router.post("/login", response_model=TokenResponse)
-async def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
     """Authenticate user and return access token"""
     try:
         # Find user by email - Updated to SQLAlchemy 2.x syntax
         stmt = select(User).where(User.email == user_data.email)
-        user = db.execute(stmt).scalar_one_or_none()
+        user = (await db.execute(stmt)).scalar_one_or_none()
+        
+        verified, upgraded_hash = (
+            verify_and_update_password(user_data.password, user.hashed_password) if user else (False, None)
+        )
         
-        if not user or not verify_password(user_data.password, user.hashed_password):
+        if not verified:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
@@ -143,6 +233,12 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
                 detail="User account is deactivated"
             )
         
+        # Transparently upgrade legacy bcrypt hashes to argon2id
+        if upgraded_hash:
+            user.hashed_password = upgraded_hash
+            await db.commit()
+            invalidate_user_cache(user.id)
+        
         # Generate access token
         access_token = create_access_token(data={"sub": str(user.id)})
         
@@ -162,9 +258,5 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information"""
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        username=current_user.username,
-        is_active=current_user.is_active
-    )
+    # response_model reads the fields straight off the ORM object
+    return current_user
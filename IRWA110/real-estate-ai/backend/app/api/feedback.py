@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import select
-from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, case, Integer
+from pydantic import BaseModel, field_serializer
+from datetime import datetime
 from app.db.base import get_db
 from app.models.user import User
 from app.models.response import Response
@@ -22,19 +23,26 @@ class FeedbackResponse(BaseModel):
     id: int
     response_id: int
     is_positive: bool
-    created_at: str
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+    
+    @field_serializer("created_at")
+    def serialize_created_at(self, created_at: datetime) -> str:
+        """Keep the isoformat() output (+00:00 rather than pydantic's Z)"""
+        return created_at.isoformat()
 
 @router.post("/", response_model=FeedbackResponse)
 async def submit_feedback(
     feedback_data: FeedbackRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Submit feedback for a property analysis response"""
     try:
-        # Check if response exists - Updated to SQLAlchemy 2.x syntax
-        stmt = select(Response).where(Response.id == feedback_data.response_id)
-        response = db.execute(stmt).scalar_one_or_none()
+        # Check if response exists - primary-key lookup via the identity map
+        response = await db.get(Response, feedback_data.response_id)
         
         if not response:
             raise HTTPException(
@@ -47,22 +55,17 @@ async def submit_feedback(
             Feedback.response_id == feedback_data.response_id,
             Feedback.user_id == current_user.id
         )
-        existing_feedback = db.execute(stmt).scalar_one_or_none()
+        existing_feedback = (await db.execute(stmt)).scalar_one_or_none()
         
         if existing_feedback:
             # Update existing feedback
             existing_feedback.is_positive = feedback_data.is_positive
-            db.commit()
-            db.refresh(existing_feedback)
+            await db.commit()
+            await db.refresh(existing_feedback)
             
             logger.info(f"Feedback updated for response {feedback_data.response_id} by user {current_user.id}")
             
-            return FeedbackResponse(
-                id=existing_feedback.id,
-                response_id=existing_feedback.response_id,
-                is_positive=existing_feedback.is_positive,
-                created_at=existing_feedback.created_at.isoformat()
-            )
+            return existing_feedback
         else:
             # Create new feedback
             new_feedback = Feedback(
@@ -72,23 +75,18 @@ async def submit_feedback(
             )
             
             db.add(new_feedback)
-            db.commit()
-            db.refresh(new_feedback)
+            await db.commit()
+            await db.refresh(new_feedback)
             
             logger.info(f"New feedback submitted for response {feedback_data.response_id} by user {current_user.id}")
             
-            return FeedbackResponse(
-                id=new_feedback.id,
-                response_id=new_feedback.response_id,
-                is_positive=new_feedback.is_positive,
-                created_at=new_feedback.created_at.isoformat()
-            )
+            return new_feedback
         
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error submitting feedback: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error submitting feedback"
@@ -98,13 +96,12 @@ async def submit_feedback(
 async def get_response_feedback(
     response_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get feedback statistics for a specific response"""
     try:
-        # Check if response exists - Updated to SQLAlchemy 2.x syntax
-        stmt = select(Response).where(Response.id == response_id)
-        response = db.execute(stmt).scalar_one_or_none()
+        # Check if response exists - primary-key lookup via the identity map
+        response = await db.get(Response, response_id)
         
         if not response:
             raise HTTPException(
@@ -112,29 +109,21 @@ async def get_response_feedback(
                 detail="Response not found"
             )
         
-        # Get feedback statistics - Updated to SQLAlchemy 2.x syntax
-        stmt = select(Feedback).where(Feedback.response_id == response_id)
-        total_feedback = len(db.execute(stmt).scalars().all())
-        
-        stmt = select(Feedback).where(
-            Feedback.response_id == response_id,
-            Feedback.is_positive == True
-        )
-        positive_feedback = len(db.execute(stmt).scalars().all())
-        
-        # Get user's feedback if any - Updated to SQLAlchemy 2.x syntax
-        stmt = select(Feedback).where(
-            Feedback.response_id == response_id,
-            Feedback.user_id == current_user.id
-        )
-        user_feedback = db.execute(stmt).scalar_one_or_none()
+        # Aggregate totals and the user's own vote in one statement
+        stmt = select(
+            func.count(Feedback.id),
+            func.sum(case((Feedback.is_positive, 1), else_=0)),
+            func.max(case((Feedback.user_id == current_user.id, Feedback.is_positive.cast(Integer))))
+        ).where(Feedback.response_id == response_id)
+        total_feedback, positive_feedback, user_feedback = (await db.execute(stmt)).one()
+        positive_feedback = positive_feedback or 0
         
         return {
             "response_id": response_id,
             "total_feedback": total_feedback,
             "positive_feedback": positive_feedback,
             "negative_feedback": total_feedback - positive_feedback,
-            "user_feedback": user_feedback.is_positive if user_feedback else None
+            "user_feedback": bool(user_feedback) if user_feedback is not None else None
         }
         
     except HTTPException:
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import select
-from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, exists
+from pydantic import BaseModel, field_serializer
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 from app.db.base import get_db
 from app.models.user import User
@@ -12,6 +13,7 @@ from app.agents.price_agent import PriceAgent
 from app.agents.location_agent import LocationAgent
 from app.agents.deal_agent import DealAgent
 from app.agents.security_agent import SecurityAgent
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -39,23 +41,45 @@ class PropertyResponse(BaseModel):
     land_details: Optional[Dict[str, Any]] = None
     currency: str = "LKR"
     price_per_sqft: Optional[float] = None
+    
+    @classmethod
+    def from_analysis(cls, db_query: Query, db_response: Response, filtered_result: Dict[str, Any]) -> "PropertyResponse":
+        """Build from server-produced values without re-running validation"""
+        return cls.model_construct(
+            estimated_price=filtered_result['estimated_price'],
+            location_score=filtered_result['location_score'],
+            deal_verdict=filtered_result['deal_verdict'],
+            why=filtered_result['why'],
+            provenance=filtered_result['provenance'],
+            confidence=filtered_result['confidence'],
+            query_id=db_query.id,
+            response_id=db_response.id,
+            land_details=filtered_result.get('land_details'),
+            currency=filtered_result.get('currency', 'LKR'),
+            price_per_sqft=filtered_result.get('price_per_sqft')
+        )
 
 class QueryHistory(BaseModel):
     id: int
     query_text: str
-    created_at: str
+    created_at: datetime
     has_response: bool
+    
+    @field_serializer("created_at")
+    def serialize_created_at(self, created_at: datetime) -> str:
+        """Keep the isoformat() output (+00:00 rather than pydantic's Z)"""
+        return created_at.isoformat()
 
 @router.post("/query", response_model=PropertyResponse)
 async def analyze_property(
     property_query: PropertyQuery,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Analyze a property using AI agents including land details"""
     try:
         # Security validation and sanitization
-        validation_result = security_agent.validate_query_features(property_query.features)
+        validation_result = security_agent.cached_validate_query_features(property_query.features)
         if not validation_result['is_valid']:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -63,7 +87,7 @@ async def analyze_property(
             )
         
         sanitized_features = validation_result['sanitized_features']
-        sanitized_query = security_agent.sanitize_input(property_query.query)
+        sanitized_query = security_agent.cached_sanitize_input(property_query.query)
         
         # Store query in database
         db_query = Query(
@@ -79,16 +103,15 @@ async def analyze_property(
             asking_price=sanitized_features.get('asking_price')
         )
         
+        # Nothing is flushed yet, so no write transaction is held open during the AI pipeline
         db.add(db_query)
-        db.commit()
-        db.refresh(db_query)
         
         # Run AI analysis pipeline including land details
         analysis_result = await _run_analysis_pipeline(sanitized_features, sanitized_query)
         
-        # Store response in database
+        # Store response in database - the relationship lets a single commit insert both rows
         db_response = Response(
-            query_id=db_query.id,
+            query=db_query,
             estimated_price=analysis_result['estimated_price'],
             location_score=analysis_result['location_score'],
             deal_verdict=analysis_result['deal_verdict'],
@@ -98,32 +121,19 @@ async def analyze_property(
         )
         
         db.add(db_response)
-        db.commit()
-        db.refresh(db_response)
+        await db.commit()
         
         # Filter output for security
         filtered_result = security_agent.filter_output(analysis_result)
         
-        return PropertyResponse(
-            estimated_price=filtered_result['estimated_price'],
-            location_score=filtered_result['location_score'],
-            deal_verdict=filtered_result['deal_verdict'],
-            why=filtered_result['why'],
-            provenance=filtered_result['provenance'],
-            confidence=filtered_result['confidence'],
-            query_id=db_query.id,
-            response_id=db_response.id,
-            land_details=filtered_result.get('land_details'),
-            currency=filtered_result.get('currency', 'LKR'),
-            price_per_sqft=filtered_result.get('price_per_sqft')
-        )
+        return PropertyResponse.from_analysis(db_query, db_response, filtered_result)
         
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error in property analysis: {e}")
         if 'db_query' in locals():
-            db.rollback()
+            await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during property analysis"
@@ -132,29 +142,25 @@ async def analyze_property(
 @router.get("/history", response_model=List[QueryHistory])
 async def get_query_history(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     limit: int = 10
 ):
     """Get user's query history"""
     try:
-        # Updated to SQLAlchemy 2.x syntax
-        stmt = select(Query).where(
+        # Resolve has_response in the same statement instead of one lookup per query
+        has_response = exists().where(Response.query_id == Query.id).label("has_response")
+        stmt = select(Query, has_response).where(
             Query.user_id == current_user.id
         ).order_by(Query.created_at.desc()).limit(limit)
-        queries = db.execute(stmt).scalars().all()
+        rows = (await db.execute(stmt)).all()
         
         history = []
-        for query in queries:
-            # Check if query has a response - Updated to SQLAlchemy 2.x syntax
-            stmt = select(Response).where(Response.query_id == query.id)
-            response = db.execute(stmt).scalar_one_or_none()
-            has_response = response is not None
-            
-            history.append(QueryHistory(
+        for query, query_has_response in rows:
+            history.append(QueryHistory.model_construct(
                 id=query.id,
                 query_text=query.query_text,
-                created_at=query.created_at.isoformat(),
-                has_response=has_response
+                created_at=query.created_at,
+                has_response=bool(query_has_response)
             ))
         
         return history
@@ -169,29 +175,38 @@ async def get_query_history(
 async def _run_analysis_pipeline(features: Dict[str, Any], query_text: str) -> Dict[str, Any]:
     """Run the complete AI analysis pipeline including land details"""
     try:
-        # 1. Price estimation
-        price_result = price_agent.estimate_price(features)
-        estimated_price = price_result['estimated_price']
-        
-        # 2. Location analysis
-        location_result = location_agent.analyze_location(
-            features.get('lat'),
-            features.get('lon'),
-            features.get('city'),
-            features.get('district')
+        # 1 & 2. Price estimation and location analysis are independent - run them concurrently
+        price_result, location_result = await asyncio.gather(
+            asyncio.to_thread(price_agent.estimate_price, features),
+            asyncio.to_thread(
+                location_agent.analyze_location,
+                features.get('lat'),
+                features.get('lon'),
+                features.get('city'),
+                features.get('district')
+            )
         )
+        estimated_price = price_result['estimated_price']
         location_score = location_result['score']
         
-        # 3. Deal evaluation
+        # 3. Deal evaluation (rule-based, cheap)
         asking_price = features.get('asking_price', 0)
         deal_result = deal_agent.evaluate_deal(asking_price, estimated_price, location_score)
         
-        # 4. Land details analysis using Gemini AI
-        land_details = deal_agent.analyze_land_details(
-            features, location_result, asking_price, estimated_price
-        )
+        # 4 & 5. Land details and LLM explanation both call Gemini - overlap them
+        llm_tasks = [
+            asyncio.to_thread(
+                deal_agent.analyze_land_details, features, location_result, asking_price, estimated_price
+            )
+        ]
+        if asking_price > 0 and estimated_price > 0:
+            llm_tasks.append(asyncio.to_thread(
+                deal_agent.llm_explain,
+                asking_price, estimated_price, location_score, features, location_result
+            ))
+        land_details, *explanations = await asyncio.gather(*llm_tasks)
         
-        # 5. Combine results
+        # 6. Combine results
         result = {
             'estimated_price': estimated_price,
             'location_score': location_score,
@@ -204,13 +219,9 @@ async def _run_analysis_pipeline(features: Dict[str, Any], query_text: str) -> D
             'price_per_sqft': price_result.get('price_per_sqft', 0)
         }
         
-        # 6. Try to get LLM explanation if available
-        if asking_price > 0 and estimated_price > 0:
-            llm_explanation = deal_agent.llm_explain(
-                asking_price, estimated_price, location_score, features, location_result
-            )
-            if llm_explanation:
-                result['llm_explanation'] = llm_explanation
+        # 7. Attach LLM explanation if available
+        if explanations and explanations[0]:
+            result['llm_explanation'] = explanations[0]
         
         return result
         
@@ -1,15 +1,24 @@
 from pydantic_settings import BaseSettings
 from typing import List
+from functools import cached_property
 import os
 
 class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./realestate.db"
+    db_pool_size: int = 20  # ignored for SQLite
+    db_max_overflow: int = 40
+    auto_create_schema: bool = False  # create tables on startup instead of via Alembic
+    
+    # Server
+    workers: int = 1  # each worker opens its own DB pool and caches
     
     # JWT
     jwt_secret: str = "change_me_to_a_secure_random_string"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    token_cache_ttl_seconds: int = 30
+    user_cache_ttl_seconds: int = 60
     
     # Gemini AI
     gemini_api_key: str = ""
@@ -20,11 +29,16 @@ class Settings(BaseSettings):
     # Security
     min_password_length: int = 8
     
+    # Password hashing (argon2id)
+    argon2_time_cost: int = 2
+    argon2_memory_cost: int = 65536  # KiB
+    argon2_parallelism: int = 2
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
 
-    @property
+    @cached_property
     def cors_origins(self) -> List[str]:
         """Convert allow_origins string to list for CORS middleware"""
         if "," in self.allow_origins:
@@ -1,16 +1,48 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from jose import JWTError, jwt
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Process-wide argon2id hasher, configured once and shared by every hash/verify call
+_HASHER = PasswordHasher(
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_cost,
+    parallelism=settings.argon2_parallelism,
+    type=Type.ID,
+)
+
+# Only used to verify legacy bcrypt hashes before they are upgraded
+_legacy_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _is_argon2_hash(hashed_password: str) -> bool:
+    return hashed_password.startswith("$argon2")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return verify_and_update_password(plain_password, hashed_password)[0]
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password and return a replacement hash if the stored one is outdated"""
+    if not _is_argon2_hash(hashed_password):
+        if not _legacy_context.verify(plain_password, hashed_password):
+            return False, None
+        return True, get_password_hash(plain_password)
+    
+    try:
+        _HASHER.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False, None
+    
+    # Rehash when the configured argon2 parameters have changed
+    if _HASHER.check_needs_rehash(hashed_password):
+        return True, get_password_hash(plain_password)
+    return True, None
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return _HASHER.hash(password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -20,12 +52,25 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+    key, algorithms = _jwt_params()
+    encoded_jwt = jwt.encode(to_encode, key, algorithm=algorithms[0])
     return encoded_jwt
 
+@lru_cache(maxsize=1)
+def _jwt_params() -> Tuple[str, Tuple[str, ...]]:
+    """Resolve the signing key and allowed algorithms once per process"""
+    return settings.jwt_secret, (settings.jwt_algorithm,)
+
 def verify_token(token: str) -> Optional[dict]:
+    key, algorithms = _jwt_params()
     try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+        # Single verified decode; tokens without exp/sub are rejected here
+        payload = jwt.decode(
+            token,
+            key,
+            algorithms=algorithms,
+            options={"require_exp": True, "require_sub": True}
+        )
         return payload
     except JWTError:
         return None
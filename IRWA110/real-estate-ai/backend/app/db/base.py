@@ -1,25 +1,69 @@
-from sqlalchemy import create_engine
+import importlib
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-# Create engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
-)
+# Async driver used for each supported backend, whatever driver the configured URL names
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _async_database_url(url: str) -> URL:
+    """Map a sync database URL onto its async driver"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(
+            f"Unsupported DATABASE_URL backend '{backend}'; expected one of: {', '.join(ASYNC_DRIVERS)}"
+        )
+    return parsed.set(drivername=ASYNC_DRIVERS[backend])
+
+_database_url = _async_database_url(settings.database_url)
+_is_sqlite = _database_url.get_backend_name() == "sqlite"
+_is_sqlite_file = _is_sqlite and _database_url.database not in (None, "", ":memory:")
+
+# Create engine - file SQLite is pooled (aiosqlite would otherwise open a new connection
+# per session), in-memory SQLite keeps its single shared connection, other backends get a larger pool
+if _is_sqlite:
+    engine_options = {"connect_args": {"check_same_thread": False}}
+    if _is_sqlite_file:
+        # Each aiosqlite connection runs on its own thread, so reusing it across sessions is safe
+        engine_options["poolclass"] = AsyncAdaptedQueuePool
+else:
+    engine_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+    }
+
+engine = create_async_engine(_database_url, **engine_options)
+
+if _is_sqlite:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """WAL lets readers proceed alongside the single writer instead of blocking on it"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+# Create SessionLocal class - objects stay usable after commit without lazy reloads
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 # Create Base class
 Base = declarative_base()
 
+# Model modules registered on Base.metadata; only imported when the schema is created
+MODEL_MODULES = ("app.models.user", "app.models.query", "app.models.response", "app.models.feedback")
+
+def import_models():
+    for module in MODEL_MODULES:
+        importlib.import_module(module)
+
 # Dependency to get DB session
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
-
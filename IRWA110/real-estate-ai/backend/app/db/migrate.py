@@ -0,0 +1,77 @@
+"""
+Bring the database to the latest Alembic revision.
+
+Databases created by the startup create_all (including the bundled realestate.db)
+have tables but no alembic_version table. They are stamped with the revision
+their schema already matches before upgrading, instead of failing on
+"table already exists" / "index already exists": head when the schema equals
+the current models, otherwise the newest revision whose indexes are present.
+
+Usage (from the backend directory): python -m app.db.migrate
+"""
+import logging
+import os
+from typing import Optional
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+from app.core.config import settings
+from app.db.base import Base, import_models
+
+logger = logging.getLogger(__name__)
+
+BASELINE_REVISION = "0001"
+BASELINE_TABLES = {"users", "queries", "responses", "feedback"}
+
+# Indexes added by each revision after the baseline, newest first
+REVISION_INDEXES = (
+    ("0002", {
+        "ix_queries_user_id_created_at",
+        "ix_responses_query_id",
+        "ix_feedback_response_id_user_id",
+        "ix_feedback_response_id_is_positive",
+    }),
+)
+
+def _unversioned_revision(database_url: str) -> Optional[str]:
+    """Revision to stamp an existing schema with, or None if it needs no stamp"""
+    engine = create_engine(database_url)
+    try:
+        with engine.connect() as conn:
+            inspector = inspect(conn)
+            tables = set(inspector.get_table_names())
+            if not BASELINE_TABLES <= tables:
+                return None
+            # An earlier failed upgrade can leave an empty version table behind
+            if "alembic_version" in tables and conn.execute(text("SELECT COUNT(*) FROM alembic_version")).scalar():
+                return None
+            
+            import_models()
+            if not compare_metadata(MigrationContext.configure(conn), Base.metadata):
+                return "head"
+            
+            indexes = {index["name"] for table in BASELINE_TABLES for index in inspector.get_indexes(table)}
+            for revision, revision_indexes in REVISION_INDEXES:
+                if revision_indexes <= indexes:
+                    return revision
+            return BASELINE_REVISION
+    finally:
+        engine.dispose()
+
+def upgrade_database() -> None:
+    backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    config = Config(os.path.join(backend_dir, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(backend_dir, "alembic"))
+    
+    revision = _unversioned_revision(settings.database_url)
+    if revision is not None:
+        logger.info(f"Existing unversioned schema found; stamping {revision}")
+        command.stamp(config, revision)
+    
+    command.upgrade(config, "head")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    upgrade_database()
@@ -1,9 +1,10 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from app.core.config import settings
 from app.api import auth, query, feedback
-from app.db.base import engine, Base
+from app.db.base import engine, Base, import_models
 import logging
 
 # Configure logging
@@ -14,7 +15,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Real Estate AI",
     description="AI-powered property analysis and valuation platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson's C encoder for large provenance/land_details payloads
 )
 
 # Add CORS middleware
@@ -26,6 +28,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (provenance, land_details); brotli-asgi is an alternative for better ratios
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include API routers
 app.include_router(auth.router)
 app.include_router(query.router)
@@ -33,14 +38,25 @@ app.include_router(feedback.router)
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database tables on startup"""
+    """Initialize database tables on startup (development only - use Alembic in production)"""
+    if not settings.auto_create_schema:
+        logger.info("Schema auto-creation disabled; run `python -m app.db.migrate` to migrate")
+        return
+    
     try:
         # Create all tables
-        Base.metadata.create_all(bind=engine)
+        import_models()
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating database tables: {e}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled database connections"""
+    await engine.dispose()
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -66,4 +82,5 @@ async def global_exception_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Workers need an import string; uvicorn picks uvloop/httptools automatically when installed
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, workers=settings.workers)
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
 class Feedback(Base):
     __tablename__ = "feedback"
+    __table_args__ = (
+        Index("ix_feedback_response_id_user_id", "response_id", "user_id"),
+        Index("ix_feedback_response_id_is_positive", "response_id", "is_positive"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     response_id = Column(Integer, ForeignKey("responses.id"), nullable=False)
@@ -1,5 +1,6 @@
 from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, JSON
 from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -7,13 +8,13 @@ class Response(Base):
     __tablename__ = "responses"
     
     id = Column(Integer, primary_key=True, index=True)
-    query_id = Column(Integer, ForeignKey("queries.id"), nullable=False)
+    query_id = Column(Integer, ForeignKey("queries.id"), nullable=False, index=True)
     estimated_price = Column(Float, nullable=True)
     location_score = Column(Float, nullable=True)
     deal_verdict = Column(String, nullable=False)  # "Good Deal", "Fair", "Overpriced"
     why = Column(Text, nullable=False)
     confidence = Column(Float, nullable=False)
-    provenance = Column(JSON, nullable=True)  # Store as JSON array
+    provenance = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # Store as JSON array (JSONB on Postgres)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -0,0 +1,57 @@
+import time
+import pytest
+from datetime import timedelta
+from app.api import auth
+from app.core.security import create_access_token
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    auth._payload_cache.clear()
+    yield
+    auth._payload_cache.clear()
+
+def test_token_payload_cached(monkeypatch):
+    """Test a verified payload is served from the cache"""
+    token = create_access_token({"sub": "1"})
+    payload = auth._get_token_payload(token)
+    assert payload["sub"] == "1"
+
+    monkeypatch.setattr(auth, "verify_token", lambda token: None)
+    assert auth._get_token_payload(token) == payload
+
+def test_token_payload_not_served_past_exp(monkeypatch):
+    """Test a cached payload expires with the token even inside the cache TTL"""
+    token = create_access_token({"sub": "1"}, expires_delta=timedelta(seconds=5))
+    payload = auth._get_token_payload(token)
+    assert payload is not None
+    assert payload["exp"] < time.time() + auth.settings.token_cache_ttl_seconds
+
+    # Past exp but still inside the TTLCache lifetime: verification must run again
+    verify_calls = []
+    def fake_verify(token):
+        verify_calls.append(token)
+        return None
+    monkeypatch.setattr(auth, "verify_token", fake_verify)
+    monkeypatch.setattr(auth.time, "time", lambda: payload["exp"] + 1)
+
+    assert auth._get_token_payload(token) is None
+    assert verify_calls == [token]
+    assert auth._token_cache_key(token) not in auth._payload_cache
+
+def test_invalidate_token_cache(monkeypatch):
+    """Test invalidation evicts the cached payload"""
+    token = create_access_token({"sub": "1"})
+    assert auth._get_token_payload(token) is not None
+    assert auth._token_cache_key(token) in auth._payload_cache
+
+    auth.invalidate_token_cache(token)
+    assert auth._token_cache_key(token) not in auth._payload_cache
+
+    monkeypatch.setattr(auth, "verify_token", lambda token: None)
+    assert auth._get_token_payload(token) is None
+
+def test_cache_key_is_not_raw_token():
+    """Test the raw token is never stored as a cache key"""
+    token = create_access_token({"sub": "1"})
+    auth._get_token_payload(token)
+    assert token not in auth._payload_cache
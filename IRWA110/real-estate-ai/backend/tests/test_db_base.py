@@ -0,0 +1,33 @@
+import pytest
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.db import base
+from app.db.base import _async_database_url
+
+@pytest.mark.parametrize("url, expected", [
+    ("sqlite:///./realestate.db", "sqlite+aiosqlite:///./realestate.db"),
+    ("sqlite://", "sqlite+aiosqlite://"),
+    ("sqlite+pysqlite:///./realestate.db", "sqlite+aiosqlite:///./realestate.db"),
+    ("postgresql://user@localhost/realestate", "postgresql+asyncpg://user@localhost/realestate"),
+    ("postgresql+psycopg2://user@localhost:5432/realestate", "postgresql+asyncpg://user@localhost:5432/realestate"),
+    ("postgresql+asyncpg://user@localhost/realestate", "postgresql+asyncpg://user@localhost/realestate"),
+])
+def test_async_database_url(url, expected):
+    """Test sync URLs are mapped onto the backend's async driver"""
+    assert _async_database_url(url).render_as_string(hide_password=False) == expected
+
+def test_async_database_url_keeps_credentials():
+    """Test the password and query string survive the driver swap"""
+    url = _async_database_url("postgresql+psycopg2://user:secret@db/realestate?application_name=irwa")
+    assert url.password == "secret"
+    assert url.query == {"application_name": "irwa"}
+
+def test_async_database_url_unsupported_backend():
+    """Test unsupported backends fail with a configuration error"""
+    with pytest.raises(ValueError, match="Unsupported DATABASE_URL backend 'mysql'"):
+        _async_database_url("mysql://user@localhost/realestate")
+
+def test_file_sqlite_is_pooled():
+    """Test file SQLite reuses connections instead of opening one per session"""
+    if not base._is_sqlite_file:
+        pytest.skip("DATABASE_URL is not a SQLite file")
+    assert isinstance(base.engine.pool, AsyncAdaptedQueuePool)
@@ -0,0 +1,65 @@
+import os
+import pytest
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+from app.core.config import settings
+from app.db.base import Base, import_models
+from app.db.migrate import REVISION_INDEXES, upgrade_database
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture
+def database_url(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'migrate.db'}"
+    monkeypatch.setattr(settings, "database_url", url)
+    return url
+
+@pytest.fixture
+def head_revision():
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    return ScriptDirectory.from_config(config).get_current_head()
+
+def _create_all(database_url):
+    import_models()
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    return engine
+
+def _current_revision(engine):
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+
+def test_upgrade_after_create_all(database_url, head_revision):
+    """Test a schema from the startup create_all is stamped at head, not re-migrated"""
+    engine = _create_all(database_url)
+    upgrade_database()
+    assert _current_revision(engine) == head_revision
+
+    # A second run is a no-op
+    upgrade_database()
+    assert _current_revision(engine) == head_revision
+    engine.dispose()
+
+def test_upgrade_pre_index_schema(database_url, head_revision):
+    """Test a create_all schema from before the index revision gets the indexes"""
+    engine = _create_all(database_url)
+    added_indexes = REVISION_INDEXES[0][1]
+    with engine.begin() as conn:
+        for index in added_indexes:
+            conn.execute(text(f"DROP INDEX {index}"))
+
+    upgrade_database()
+    indexes = {index["name"] for table in ("queries", "responses", "feedback") for index in inspect(engine).get_indexes(table)}
+    assert added_indexes <= indexes
+    assert _current_revision(engine) == head_revision
+    engine.dispose()
+
+def test_upgrade_empty_database(database_url, head_revision):
+    """Test an empty database is migrated from scratch"""
+    upgrade_database()
+    engine = create_engine(database_url)
+    assert {"users", "queries", "responses", "feedback"} <= set(inspect(engine).get_table_names())
+    assert _current_revision(engine) == head_revision
+    engine.dispose()
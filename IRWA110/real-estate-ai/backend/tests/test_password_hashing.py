@@ -0,0 +1,49 @@
+import pytest
+from argon2 import PasswordHasher, Type
+from passlib.context import CryptContext
+from app.core.security import get_password_hash, verify_and_update_password, verify_password
+
+PASSWORD = "correct horse battery staple"
+
+@pytest.fixture
+def legacy_hash():
+    return CryptContext(schemes=["bcrypt"]).hash(PASSWORD)
+
+def test_get_password_hash_argon2id():
+    """Test new hashes use argon2id"""
+    assert get_password_hash(PASSWORD).startswith("$argon2id$")
+
+def test_legacy_bcrypt_upgraded(legacy_hash):
+    """Test a legacy bcrypt hash verifies and gets an argon2id replacement"""
+    verified, new_hash = verify_and_update_password(PASSWORD, legacy_hash)
+    assert verified is True
+    assert new_hash.startswith("$argon2id$")
+    assert verify_and_update_password(PASSWORD, new_hash) == (True, None)
+
+def test_legacy_bcrypt_wrong_password(legacy_hash):
+    """Test a wrong password against a legacy hash is rejected"""
+    assert verify_and_update_password("wrong password", legacy_hash) == (False, None)
+
+def test_wrong_password():
+    """Test a wrong password is rejected without a replacement hash"""
+    hashed = get_password_hash(PASSWORD)
+    assert verify_and_update_password("wrong password", hashed) == (False, None)
+    assert verify_password("wrong password", hashed) is False
+
+def test_current_hash_not_rehashed():
+    """Test a hash with the current parameters needs no update"""
+    hashed = get_password_hash(PASSWORD)
+    assert verify_and_update_password(PASSWORD, hashed) == (True, None)
+    assert verify_password(PASSWORD, hashed) is True
+
+def test_outdated_argon2_parameters_rehashed():
+    """Test a hash made with different argon2 parameters is rehashed"""
+    old_hash = PasswordHasher(time_cost=1, memory_cost=8192, parallelism=1, type=Type.ID).hash(PASSWORD)
+    verified, new_hash = verify_and_update_password(PASSWORD, old_hash)
+    assert verified is True
+    assert new_hash is not None and new_hash != old_hash
+    assert verify_and_update_password(PASSWORD, new_hash) == (True, None)
+
+def test_malformed_argon2_hash():
+    """Test a corrupt argon2 hash is rejected rather than raising"""
+    assert verify_and_update_password(PASSWORD, "$argon2id$not-a-hash") == (False, None)
@@ -124,3 +124,41 @@ def test_validate_query_features_sanitization(security_agent):
     sanitized_city = result["sanitized_features"]["city"]
     assert "<script>" not in sanitized_city
 
+def test_cached_validate_query_features_result_is_isolated(security_agent):
+    """Test repeated cached validation returns equal results that callers cannot corrupt"""
+    features = {"city": "Colombo", "asking_price": 200000}
+    
+    first = security_agent.cached_validate_query_features(features)
+    first["sanitized_features"]["city"] = "Tampered"
+    first["errors"].append("Tampered")
+    
+    second = security_agent.cached_validate_query_features(features)
+    
+    assert second["sanitized_features"]["city"] == "Colombo"
+    assert second["errors"] == []
+
+def test_cached_validate_query_features_unhashable_values(security_agent):
+    """Test cached validation still works when feature values cannot be cached"""
+    features = {"city": "Colombo", "asking_price": 200000, "amenities": ["pool"]}
+    
+    result = security_agent.cached_validate_query_features(features)
+    
+    assert result["is_valid"] is True
+    assert security_agent._validate_cached.cache_info().currsize == 0
+
+def test_cached_inputs_oversized_not_retained(security_agent):
+    """Test oversized query text and features are processed but never cached"""
+    long_text = "A" * 5000
+    features = {"city": "C" * 5000, "asking_price": 200000}
+    
+    assert security_agent.cached_sanitize_input(long_text) == security_agent.sanitize_input(long_text)
+    assert security_agent.cached_validate_query_features(features)["is_valid"] is True
+    
+    assert security_agent._sanitize_cached.cache_info().currsize == 0
+    assert security_agent._validate_cached.cache_info().currsize == 0
+
+def test_filter_output_does_not_populate_cache(security_agent):
+    """Test output filtering bypasses the query input cache"""
+    security_agent.filter_output({"why": "One-off explanation", "provenance": []})
+    
+    assert security_agent._sanitize_cached.cache_info().currsize == 0
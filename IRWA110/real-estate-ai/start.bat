@@ -46,8 +46,8 @@ if not exist ".env" (
 
 REM Initialize database
 echo 🗄️  Initializing database...
-alembic revision --autogenerate -m "Initial migration"
-alembic upgrade head
+REM Stamps databases created by create_all at the baseline, then upgrades to head
+python -m app.db.migrate
 
 echo ✅ Backend setup complete!
 cd ..
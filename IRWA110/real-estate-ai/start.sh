@@ -43,8 +43,8 @@ fi
 
 # Initialize database
 echo "🗄️  Initializing database..."
-alembic revision --autogenerate -m "Initial migration"
-alembic upgrade head
+# Stamps databases created by create_all at the baseline, then upgrades to head
+python -m app.db.migrate
 
 echo "✅ Backend setup complete!"
 cd ..